@@ -3,23 +3,44 @@
 Deepeval FastAPI Sidecar Server
 This runs separately from the Node.js server and provides LLM evaluation metrics.
 
+All JSON responses are encoded with orjson (ORJSONResponse is the app-wide
+default), so multi-metric /eval payloads with long explanations serialize at
+C speed.
+
 Installation:
   pip install fastapi uvicorn deepeval
 
 Usage:
   python deepeval_server.py
-  # or
+  # or (development)
   uvicorn deepeval_server:app --reload --host 0.0.0.0 --port 8000
+  # or (production, multi-process)
+  gunicorn -c gunicorn_conf.py deepeval_server:app
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, List, Union
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+import asyncio
+import concurrent.futures
+import hashlib
+import json
 import logging
 import os
+import re
+import sqlite3
+import threading
+import time
+import httpx
+import orjson
 from dotenv import load_dotenv
 from openai import OpenAI
+from prometheus_client import Counter, Histogram, make_asgi_app
 
 # Load environment variables
 load_dotenv()
@@ -28,13 +49,204 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client for every LLM SDK instance. The OpenAI/Azure SDKs create
+# their own httpx client with small default pools, so each new model wrapper
+# pays a fresh TLS handshake per connection. One shared client with generous
+# keep-alive limits lets repeated evaluations reuse the same TLS sessions.
+# HTTP/2 multiplexes DeepEval's many small verdict calls over one connection,
+# and compressed responses cut bytes-on-wire for the large JSON payloads.
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=64,
+    max_connections=128,
+    keepalive_expiry=60,
+)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+_HTTP_HEADERS = {"Accept-Encoding": "gzip, br"}
+
+_HTTP = httpx.Client(
+    limits=_HTTP_LIMITS,
+    timeout=_HTTP_TIMEOUT,
+    headers=_HTTP_HEADERS,
+    http2=True,
+)
+
+# Opt-in short-circuit: skip the LLM entirely when the inputs trivially
+# determine the score (e.g. empty output). Set SKIP_TRIVIAL=1 to enable.
+SKIP_TRIVIAL = os.getenv("SKIP_TRIVIAL", "0") == "1"
+
+# Opt-in exact deduplication of retrieval-context passages before they reach
+# DeepEval: repeated chunks only inflate prompt tokens. Set DEDUP_CONTEXT=1
+# to enable.
+DEDUP_CONTEXT = os.getenv("DEDUP_CONTEXT", "0") == "1"
+
+# Bound concurrent evaluations so bursts do not trigger provider 429s or let
+# tail latency collapse into timeout storms. Requests that cannot start
+# within QUEUE_TIMEOUT_MS are shed with a 429 + Retry-After instead.
+MAX_IN_FLIGHT = int(os.getenv("MAX_IN_FLIGHT", "32"))
+QUEUE_TIMEOUT_MS = int(os.getenv("QUEUE_TIMEOUT_MS", "5000"))
+_EVAL_SEM = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+# Dedicated pool for the synchronous DeepEval evaluate path. asyncio's default
+# executor is shared with everything else on the loop (DNS, file I/O), so long
+# metric runs would starve it; a named pool keeps evaluation threads bounded
+# and isolated.
+_EVAL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("EVAL_WORKERS", "16")),
+    thread_name_prefix="eval",
+)
+
+# Hedged completions get threads of their own: a hedge submitted from an
+# _EVAL_EXECUTOR worker must not queue behind the evaluations occupying that
+# same pool, or saturated eval workers deadlock waiting on each other.
+_HEDGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("HEDGE_WORKERS", "32")),
+    thread_name_prefix="hedge",
+)
+
+# Deterministic PII prefilter: these classes are mechanically detectable, so
+# a compiled-regex scan resolves the obvious cases without an LLM round-trip.
+# Set PII_FAST_SCAN=0 to always use the LLM judge.
+PII_FAST_SCAN = os.getenv("PII_FAST_SCAN", "1") == "1"
+
+_PII_PATTERNS = {
+    "email": re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"),
+    "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
+    "phone": re.compile(r"\b(?:\+?1[-.\s]?)?(?:\(\d{3}\)|\d{3})[-.\s]\d{3}[-.\s]\d{4}\b"),
+    "ipv4": re.compile(
+        r"\b(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\b"
+    ),
+    "credit_card": re.compile(r"\b(?:\d[ -]?){13,16}\b"),
+}
+
+# Labels that are suggestive but not decisive on their own: a valid dotted
+# quad is just as likely a version string ("upgrade to 1.2.3.4") in this
+# domain, so a lone ipv4 hit defers to the LLM judge instead of scoring 1.0.
+_WEAK_PII_LABELS = frozenset({"ipv4"})
+
+
+# Optional Hyperscan acceleration for the PII prefilter: a JIT-compiled DFA
+# scans every pattern in one pass at memory speed instead of one re.search
+# per pattern. Used automatically when python-hyperscan is importable; set
+# HYPERSCAN=0 to force the re fallback.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_HS_LABELS = list(_PII_PATTERNS)
+_HS_DB = None
+if hyperscan is not None and os.getenv("HYPERSCAN", "1") == "1":
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[p.pattern.encode() for p in _PII_PATTERNS.values()],
+            ids=list(range(len(_PII_PATTERNS))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_PII_PATTERNS),
+        )
+    except Exception as hs_err:
+        logger.warning(f"Hyperscan compile failed, using re fallback: {hs_err}")
+        _HS_DB = None
+
+
+def _hs_match_labels(text: str) -> List[str]:
+    """Single-pass Hyperscan scan returning the matched pattern labels."""
+    found = set()
+    _HS_DB.scan(
+        text.encode(),
+        match_event_handler=lambda pat_id, start, end, flags, ctx: found.add(pat_id),
+    )
+    return [_HS_LABELS[i] for i in sorted(found)]
+
+
+def _luhn_valid(number: str) -> bool:
+    """Luhn checksum used to confirm credit-card candidates."""
+    digits = [int(d) for d in number if d.isdigit()]
+    if not 13 <= len(digits) <= 19:
+        return False
+    checksum = 0
+    for i, d in enumerate(reversed(digits)):
+        if i % 2 == 1:
+            d *= 2
+            if d > 9:
+                d -= 9
+        checksum += d
+    return checksum % 10 == 0
+
+
+def _fast_pii_scan(text: str) -> Optional[tuple[float, str]]:
+    """Resolve pii_leakage without the LLM when a pattern decides it.
+
+    Returns (score, explanation) on a confident pattern hit, a clean 0.0 for
+    short text with no matches, and None when the LLM judge should decide
+    (longer text may still carry names or addresses regex cannot see, and
+    weak signals like a bare dotted quad need contextual judgment).
+    """
+    if _HS_DB is not None:
+        candidates = _hs_match_labels(text)
+    else:
+        candidates = [label for label, pattern in _PII_PATTERNS.items() if pattern.search(text)]
+
+    hits = []
+    for label in candidates:
+        if label == "credit_card":
+            # Confirm with Luhn across every digit run, not just the first:
+            # a benign ID (order number, tracking code) can precede a real
+            # card number in the same text.
+            if not any(
+                _luhn_valid(m.group())
+                for m in _PII_PATTERNS["credit_card"].finditer(text)
+            ):
+                continue
+        hits.append(label)
+
+    confident = [label for label in hits if label not in _WEAK_PII_LABELS]
+    if confident:
+        return 1.0, f"Deterministic PII patterns detected: {', '.join(confident)}."
+    if hits:
+        # Only weak signals matched; let the LLM judge the context
+        return None
+    if len(text) < 64:
+        return 0.0, "No PII patterns detected in short output."
+    return None
+
+
+@lru_cache(maxsize=128)
+def _schema_adapter(schema_cls) -> TypeAdapter:
+    """Return a compiled TypeAdapter for a schema class, built once.
+
+    DeepEval reuses a small set of schema classes across millions of
+    structured-output calls; caching the adapter pays the validator compile
+    cost a single time per class.
+    """
+    return TypeAdapter(schema_cls)
+
 # Import DeepEval base class
 from deepeval.models.base_model import DeepEvalBaseLLM
 
+# Metric and test-case classes are imported once here rather than inside each
+# evaluate_* call: per-request imports take the import lock and walk
+# sys.modules on the hot path, which adds up under concurrent load.
+from deepeval.test_case import LLMTestCase, ConversationalTestCase
+from deepeval.metrics.faithfulness.faithfulness import FaithfulnessMetric
+from deepeval.metrics.answer_relevancy.answer_relevancy import AnswerRelevancyMetric
+from deepeval.metrics.contextual_precision.contextual_precision import ContextualPrecisionMetric
+from deepeval.metrics.contextual_recall.contextual_recall import ContextualRecallMetric
+from deepeval.metrics.conversation_completeness.conversation_completeness import (
+    ConversationCompletenessMetric,
+)
+from deepeval.metrics.hallucination.hallucination import HallucinationMetric
+
+try:
+    from deepeval.metrics import PIILeakageMetric
+except ImportError:  # older deepeval releases don't ship this metric
+    PIILeakageMetric = None
+
 app = FastAPI(
     title="Deepeval Evaluation Service",
     description="FastAPI sidecar for LLM evaluation using Deepeval",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes responses at C speed instead of the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware to allow Node.js calls
@@ -46,12 +258,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus counters are lock-free atomic increments, far cheaper than the
+# log lines they complement. Scrape at GET /metrics (per-process registry;
+# under gunicorn each worker exposes its own counts).
+EVAL_COUNT = Counter(
+    "eval_requests_total",
+    "Metric evaluations by outcome",
+    ["metric", "status"],
+)
+EVAL_LATENCY = Histogram(
+    "eval_latency_seconds",
+    "Wall time per metric evaluation",
+    ["metric"],
+)
+app.mount("/metrics", make_asgi_app())
+
+
+# Shared pydantic config for the API models: unknown fields are dropped
+# instead of validated, and the optional validation passes (assignment
+# re-validation, whitespace stripping, arbitrary-type support) stay off so
+# per-request validation does the minimum work.
+_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_assignment=False,
+    str_strip_whitespace=False,
+    arbitrary_types_allowed=False,
+)
+
 
 class EvalRequest(BaseModel):
     """Request body for evaluation.
-    
+
     Properly separates user query, retrieved context, and model output for accurate metric scoring.
     """
+    model_config = _MODEL_CONFIG
+
     query: Optional[str] = None  # what the user asked
     context: Optional[List[str]] = None  # list of retrieved docs or source passages
     output: Optional[str] = None  # model's answer to be evaluated (REQUIRED for most metrics, not for conversation_completeness)
@@ -59,10 +300,13 @@ class EvalRequest(BaseModel):
     metric: Optional[Union[str, List[str]]] = "faithfulness"  # metric(s) to evaluate - string, array, or "all"
     expected_output: Optional[str] = None  # required for contextual_* metrics
     messages: Optional[List[dict]] = None  # for conversation_completeness: list of {role, content}
+    cache_bypass: Optional[bool] = False  # skip the score cache for this request
 
 
 class MetricResult(BaseModel):
     """Individual metric evaluation result"""
+    model_config = _MODEL_CONFIG
+
     metric_name: str
     score: Optional[float] = None
     explanation: Optional[str] = None
@@ -71,6 +315,8 @@ class MetricResult(BaseModel):
 
 class EvalResponse(BaseModel):
     """Response with evaluation metrics"""
+    model_config = _MODEL_CONFIG
+
     results: List[MetricResult]  # Array of metric results
     # Legacy fields for backward compatibility (when single metric)
     metric_name: Optional[str] = None
@@ -79,54 +325,147 @@ class EvalResponse(BaseModel):
     error: Optional[str] = None
 
 
-class GroqModel(DeepEvalBaseLLM):
-    """Custom Groq model wrapper for DeepEval compatibility."""
-    
-    def __init__(self, api_key: str, model: str = "llama-3.3-70b-versatile"):
-        """Initialize Groq client.
-        """
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.groq.com/openai/v1"
-        )
-        self.model_name = model
-        logger.info(f"Initialized Groq model: {model}")
+class EvalBatchRequest(BaseModel):
+    """Request body for batch evaluation: many EvalRequests in one call."""
+    model_config = _MODEL_CONFIG
 
+    items: List[EvalRequest]
+    max_concurrency: int = 10  # bounded fan-out across items
 
-class AzureOpenAIModel(DeepEvalBaseLLM):
-    """Custom Azure OpenAI model wrapper for DeepEval compatibility."""
-    
-    def __init__(self, api_key: str, endpoint: str, deployment_name: str, api_version: str = "2024-02-15-preview"):
-        """Initialize Azure OpenAI client.
-        
-        Args:
-            api_key: Azure OpenAI API key
-            endpoint: Azure OpenAI endpoint URL
-            deployment_name: Azure deployment name
-            api_version: API version to use
-        """
-        from openai import AzureOpenAI
-        
-        self.client = AzureOpenAI(
-            api_key=api_key,
-            api_version=api_version,
-            azure_endpoint=endpoint
+
+class EvalBatchResponse(BaseModel):
+    """Response with one EvalResponse per submitted item, in input order."""
+    model_config = _MODEL_CONFIG
+
+    items: List[EvalResponse]
+
+
+class ScoreCache:
+    """SQLite-backed cache of metric scores keyed by the full request tuple.
+
+    DeepEval's in-process use_cache does not survive across processes, so CI
+    and regression suites re-pay multi-second LLM chains for payloads they
+    have already scored. Hashing (metric, model, query, context, output,
+    expected_output, messages) turns those repeats into a single SELECT.
+
+    A small in-memory LRU sits in front of SQLite so hot repeats — the fixed
+    /example payload, client-side retries of identical requests — skip the
+    database entirely.
+    """
+
+    # Entries kept in the in-memory tier before the oldest is evicted
+    _MEM_CAPACITY = 1024
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS score_cache ("
+            "key TEXT PRIMARY KEY, score REAL, explanation TEXT, ts INTEGER)"
         )
-        self.deployment_name = deployment_name
-        self.model_name = deployment_name  # Keep this clean without 'azure:' prefix
-        logger.info(f"Initialized Azure OpenAI model: {deployment_name} at {endpoint}")
-    
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._mem: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        metric_name: str,
+        model_name: str,
+        query: Optional[str],
+        context: Optional[List[str]],
+        output: str,
+        expected_output: Optional[str],
+        messages: Optional[List[dict]]
+    ) -> str:
+        """Build a stable hash for one evaluation request."""
+        payload = json.dumps({
+            "metric": metric_name,
+            "model": model_name,
+            "query": query,
+            # Context order is part of the key: contextual_precision scores
+            # retrieval ranking, so reordered passages are a different request
+            "context": context or [],
+            "output": output,
+            "expected_output": expected_output,
+            "messages": messages,
+        }, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+    def _mem_store(self, key: str, value: tuple) -> None:
+        """Insert into the LRU tier, evicting the oldest entry when full."""
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        if len(self._mem) > self._MEM_CAPACITY:
+            self._mem.popitem(last=False)
+
+    def get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            hit = self._mem.get(key)
+            if hit is not None:
+                self._mem.move_to_end(key)
+                return hit
+            row = self._conn.execute(
+                "SELECT score, explanation FROM score_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                self._mem_store(key, (row[0], row[1]))
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, score: float, explanation: str) -> None:
+        with self._lock:
+            self._mem_store(key, (score, explanation))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO score_cache (key, score, explanation, ts) "
+                "VALUES (?, ?, ?, ?)",
+                (key, score, explanation, int(time.time()))
+            )
+            self._conn.commit()
+
+
+class _DeepEvalOpenAIMixin:
+    """Shared DeepEval plumbing for the OpenAI-compatible model wrappers.
+
+    Subclasses set self.client / self.model_name in __init__; generation and
+    the DeepEvalBaseLLM hooks are identical across providers because Groq
+    and Azure both speak the OpenAI chat-completions protocol (Azure routes
+    by deployment name, which the wrapper stores as model_name).
+    """
+
     def load_model(self):
         """Load model - required by DeepEvalBaseLLM."""
         return self.client
-    
-    def generate(self, prompt: str, schema: Optional[object] = None) -> str:
-        """Generate completion using Azure OpenAI API.
-        
+
+    # Subclasses may configure a hedged fallback (see AzureOpenAIModel);
+    # without one, generate() goes straight to the primary client.
+    fallback_client = None
+
+    # Whether the provider accepts response_format={"type": "json_object"}
+    # together with stream=True. OpenAI and Azure do; Groq rejects the
+    # combination, so GroqModel overrides this to fall back to a plain
+    # (non-streamed) completion for structured output.
+    supports_json_streaming = True
+
+    # Thread-local hedge bookkeeping: each metric evaluation runs start to
+    # finish on one executor thread, so a per-thread flag records whether
+    # any completion in the current measure came from the fallback model.
+    _hedge_state = threading.local()
+
+    def reset_fallback_flag(self) -> None:
+        """Clear the fallback marker before a new metric evaluation."""
+        self._hedge_state.fallback_served = False
+
+    def fallback_served(self) -> bool:
+        """Whether the hedge fallback produced a completion since the last reset."""
+        return getattr(self._hedge_state, "fallback_served", False)
+
+    def _complete(self, client, model: str, prompt: str, schema: Optional[object] = None) -> str:
+        """Run one chat completion against a specific client and model.
+
         Args:
+            client: OpenAI-compatible client to call
+            model: Model (or Azure deployment) name
             prompt: The input prompt
             schema: Optional Pydantic model for structured output
-        
+
         Returns:
             Generated text response or JSON string if schema provided
         """
@@ -135,112 +474,199 @@ class AzureOpenAIModel(DeepEvalBaseLLM):
             if schema:
                 # Request JSON format in the prompt
                 json_prompt = f"{prompt}\n\nRespond with valid JSON only, no other text."
-                
-                response = self.client.chat.completions.create(
-                    deployment_id=self.deployment_name,
+
+                response = client.chat.completions.create(
+                    model=model,
                     messages=[
                         {"role": "system", "content": "You are a helpful assistant that responds in JSON format."},
                         {"role": "user", "content": json_prompt}
                     ],
                     temperature=0.0,
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},  # Enable JSON mode
+                    stream=self.supports_json_streaming
                 )
-                
-                content = response.choices[0].message.content
-                
+
+                if self.supports_json_streaming:
+                    # Accumulate streamed deltas; validation still happens on
+                    # the full payload after the final chunk
+                    chunks = []
+                    for chunk in response:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            chunks.append(chunk.choices[0].delta.content)
+                    content = "".join(chunks)
+                else:
+                    content = response.choices[0].message.content
+
                 # Parse and validate JSON against schema if it's a Pydantic model
                 try:
-                    import json
-                    json_data = json.loads(content)
+                    json_data = orjson.loads(content)
                     # If schema is a Pydantic model, validate and return instance
-                    if hasattr(schema, 'model_validate'):
-                        return schema.model_validate(json_data)
+                    if hasattr(schema, 'model_fields'):
+                        return _schema_adapter(schema).validate_python(json_data)
                     return content
                 except Exception as json_err:
                     logger.warning(f"Failed to parse JSON response: {str(json_err)[:100]}")
                     return content
             else:
-                # Regular text generation
-                response = self.client.chat.completions.create(
-                    deployment_id=self.deployment_name,
+                # Regular text generation with neutral system message,
+                # streamed to cut time-to-first-token
+                response = client.chat.completions.create(
+                    model=model,
                     messages=[{"role": "user", "content": prompt}],
-                    temperature=0.0
+                    temperature=0.0,
+                    stream=True
                 )
-                return response.choices[0].message.content
-                
+                return "".join(
+                    chunk.choices[0].delta.content
+                    for chunk in response
+                    if chunk.choices and chunk.choices[0].delta.content
+                )
+
         except Exception as e:
-            logger.error(f"Azure OpenAI API error: {str(e)}")
+            logger.error(f"{type(self).__name__} API error: {str(e)}")
             raise
-    
-    def load_model(self):
-        """Load model - required by DeepEvalBaseLLM."""
-        return self.client
-    
+
     def generate(self, prompt: str, schema: Optional[object] = None) -> str:
-        """Generate completion using Groq API.
-        
-        Args:
-            prompt: The input prompt
-            schema: Optional Pydantic model for structured output
-        
-        Returns:
-            Generated text response or JSON string if schema provided
+        """Generate a completion, hedging slow primaries when configured.
+
+        The metrics run with async_mode=False, so this sync path is the one
+        every measure() call takes. Without a fallback client the call goes
+        straight to the provider. With one, the primary gets a hedge_timeout
+        head start before a direct OpenAI call is raced against it, and the
+        first *successful* completion wins — a fast failure must not beat a
+        still-running sibling.
         """
+        if self.fallback_client is None:
+            return self._complete(self.client, self.model_name, prompt, schema)
+
+        primary = _HEDGE_EXECUTOR.submit(
+            self._complete, self.client, self.model_name, prompt, schema
+        )
         try:
-            # Check if we need structured output
-            if schema:
-                # Request JSON format in the prompt
-                json_prompt = f"{prompt}\n\nRespond with valid JSON only, no other text."
-                
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that responds in JSON format."},
-                        {"role": "user", "content": json_prompt}
-                    ],
-                    temperature=0.0,
-                    response_format={"type": "json_object"}  # Enable JSON mode
-                )
-                
-                content = response.choices[0].message.content
-                
-                # Parse and validate JSON against schema if it's a Pydantic model
-                try:
-                    import json
-                    json_data = json.loads(content)
-                    # If schema is a Pydantic model, validate and return instance
-                    if hasattr(schema, 'model_validate'):
-                        return schema.model_validate(json_data)
-                    return content
-                except Exception as json_err:
-                    logger.warning(f"Failed to parse JSON response: {str(json_err)[:100]}")
-                    return content
-            else:
-                # Regular text generation with neutral system message
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.0
-                )
-                return response.choices[0].message.content
-                
-        except Exception as e:
-            logger.error(f"Groq API error: {str(e)}")
-            raise
-    
+            return primary.result(timeout=self.hedge_timeout)
+        except concurrent.futures.TimeoutError:
+            logger.warning(
+                f"[Hedge] {self.model_name} exceeded {self.hedge_timeout:.1f}s; racing fallback {self.fallback_model}"
+            )
+        except Exception:
+            # Primary failed outright; the fallback is the only option left
+            logger.warning(f"[Hedge] {self.model_name} failed; trying fallback {self.fallback_model}")
+            self._hedge_state.fallback_served = True
+            return self._complete(self.fallback_client, self.fallback_model, prompt, schema)
+
+        fallback = _HEDGE_EXECUTOR.submit(
+            self._complete, self.fallback_client, self.fallback_model, prompt, schema
+        )
+
+        # Cancel on the loser is best effort for sync futures: a call already
+        # in flight finishes in the background and its connection returns to
+        # the shared pool.
+        remaining = {primary, fallback}
+        first_error = None
+        while remaining:
+            done, remaining = concurrent.futures.wait(
+                remaining, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    for loser in remaining:
+                        loser.cancel()
+                    if future is fallback:
+                        self._hedge_state.fallback_served = True
+                    return future.result()
+                if first_error is None:
+                    first_error = future.exception()
+        raise first_error
+
     async def a_generate(self, prompt: str, schema: Optional[object] = None) -> str:
-        """Async generate - for DeepEval compatibility."""
-        return self.generate(prompt, schema)
-    
+        """Async entry required by DeepEvalBaseLLM.
+
+        The metrics are constructed with async_mode=False, so DeepEval only
+        calls the sync generate; this delegate keeps the contract for any
+        direct async caller without blocking the event loop, and inherits
+        the hedging behavior.
+        """
+        return await asyncio.to_thread(self.generate, prompt, schema)
+
     def get_model_name(self) -> str:
         """Return model name - required by DeepEvalBaseLLM."""
         return self.model_name
-    
+
     def should_use_azure_openai(self) -> bool:
         """Check if using Azure - required by DeepEvalBaseLLM."""
         return False
 
 
+class GroqModel(_DeepEvalOpenAIMixin, DeepEvalBaseLLM):
+    """Custom Groq model wrapper for DeepEval compatibility."""
+
+    # Groq rejects JSON mode combined with streaming
+    supports_json_streaming = False
+
+    def __init__(self, api_key: str, model: str = "llama-3.3-70b-versatile"):
+        """Initialize Groq client.
+        """
+        self.client = OpenAI(
+            api_key=api_key,
+            base_url="https://api.groq.com/openai/v1",
+            http_client=_HTTP
+        )
+        self.model_name = model
+        logger.info(f"Initialized Groq model: {model}")
+
+
+class OpenAIModel(_DeepEvalOpenAIMixin, DeepEvalBaseLLM):
+    """Custom OpenAI model wrapper with client-scoped credentials.
+
+    Used instead of deepeval's GPTModel so the API key stays on the client
+    rather than being exported through os.environ, which races under
+    multi-worker deployments and bypasses the shared HTTP pool.
+    """
+
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+        """Initialize OpenAI client."""
+        self.client = OpenAI(api_key=api_key, http_client=_HTTP)
+        self.model_name = model
+        logger.info(f"Initialized OpenAI model: {model}")
+
+
+class AzureOpenAIModel(_DeepEvalOpenAIMixin, DeepEvalBaseLLM):
+    """Custom Azure OpenAI model wrapper for DeepEval compatibility."""
+
+    def __init__(self, api_key: str, endpoint: str, deployment_name: str, api_version: str = "2024-02-15-preview"):
+        """Initialize Azure OpenAI client.
+
+        Args:
+            api_key: Azure OpenAI API key
+            endpoint: Azure OpenAI endpoint URL
+            deployment_name: Azure deployment name
+            api_version: API version to use
+        """
+        from openai import AzureOpenAI
+
+        self.client = AzureOpenAI(
+            api_key=api_key,
+            api_version=api_version,
+            azure_endpoint=endpoint,
+            http_client=_HTTP
+        )
+        self.deployment_name = deployment_name
+        self.model_name = deployment_name  # Keep this clean without 'azure:' prefix
+
+        # Hedged fallback: Azure PTU deployments occasionally hang for
+        # multiple seconds, so when a plain OpenAI key is available we give
+        # Azure a HEDGE_TIMEOUT_MS head start and then race a direct OpenAI
+        # call, returning whichever succeeds first (see generate).
+        self.fallback_model = os.getenv("HEDGE_FALLBACK_MODEL", "gpt-4o-mini")
+        self.hedge_timeout = float(os.getenv("HEDGE_TIMEOUT_MS", "2500")) / 1000.0
+        fallback_key = os.getenv("OPENAI_API_KEY")
+        if fallback_key:
+            self.fallback_client = OpenAI(api_key=fallback_key, http_client=_HTTP)
+            logger.info(f"Hedged fallback enabled: {self.fallback_model} after {self.hedge_timeout:.1f}s")
+
+        logger.info(f"Initialized Azure OpenAI model: {deployment_name} at {endpoint}")
+
+
 class MetricEvaluator:
     """Enterprise-grade metric evaluation system with hybrid strictness approach.
     
@@ -267,7 +693,28 @@ class MetricEvaluator:
         "hallucination": "Detects hallucinations in LLM output compared to context (lower is better, 0 = no hallucinations)",
         "pii_leakage": "Detects personally identifiable information (PII) leaks in LLM output (lower is better, 0 = no PII detected)"
     }
-    
+
+    # Frozen view of the metric names for O(1) membership checks
+    _METRICS_SET = frozenset(SUPPORTED_METRICS)
+
+    # Metric-specific required request fields, checked declaratively in
+    # evaluate(). Keys match the evaluate() argument names.
+    _REQS = {
+        "contextual_precision": ("expected_output", "context"),
+        "contextual_recall": ("expected_output", "context"),
+        "answer_relevancy": ("query",),
+        "conversation_completeness": ("messages",),
+        "hallucination": ("context",),
+    }
+
+    # Human-readable hints for missing-field errors
+    _FIELD_HINTS = {
+        "expected_output": "'expected_output' field",
+        "context": "'context' field (list of retrieved passages)",
+        "query": "'query' field (the user's question)",
+        "messages": "'messages' field (list of conversation turns with role and content)",
+    }
+
     def __init__(self, api_key: str, model_name: str = "llama-3.3-70b-versatile", use_groq: bool = False, 
                  use_azure: bool = False, azure_endpoint: Optional[str] = None, 
                  azure_deployment: Optional[str] = None, azure_api_version: str = "2024-02-15-preview"):
@@ -306,15 +753,70 @@ class MetricEvaluator:
             logger.info(f"Using Groq API with model: {model_name}")
             self.model = GroqModel(api_key=api_key, model=model_name)
         else:
-            # Standard OpenAI
-            os.environ["OPENAI_API_KEY"] = api_key
+            # Standard OpenAI with client-scoped credentials
             logger.info(f"Using OpenAI API with model: {model_name}")
-            from deepeval.models import GPTModel
-            self.model = GPTModel(model=model_name)
-    
+            self.model = OpenAIModel(api_key=api_key, model=model_name)
+
+        # Persistent score cache shared across processes. Disable by setting
+        # SCORE_CACHE_PATH to an empty string.
+        cache_path = os.getenv("SCORE_CACHE_PATH", "deepeval_score_cache.db")
+        self.score_cache = ScoreCache(cache_path) if cache_path else None
+
+        # Metric objects keep per-measure state (score/reason), so sharing
+        # one instance needs a lock that serializes every concurrent request
+        # for the same metric — which would collapse the thread pool to an
+        # effective concurrency of 1 under single-metric traffic. Since
+        # construction is trivial next to the LLM calls measure() makes,
+        # build a fresh instance per call from these bound factories instead.
+        metric_kwargs = {
+            "model": self.model,
+            "include_reason": True,
+            "async_mode": False,
+            "strict_mode": False,
+        }
+        self._metric_factories = {
+            "faithfulness": partial(
+                FaithfulnessMetric,
+                penalize_ambiguous_claims=False,
+                **metric_kwargs
+            ),
+            "answer_relevancy": partial(AnswerRelevancyMetric, **metric_kwargs),
+            "contextual_precision": partial(ContextualPrecisionMetric, **metric_kwargs),
+            "contextual_recall": partial(ContextualRecallMetric, **metric_kwargs),
+            "conversation_completeness": partial(ConversationCompletenessMetric, **metric_kwargs),
+            "hallucination": partial(HallucinationMetric, **metric_kwargs),
+        }
+        if PIILeakageMetric is not None:
+            self._metric_factories["pii_leakage"] = partial(PIILeakageMetric, **metric_kwargs)
+
+        # O(1) routing table used by evaluate() instead of an if/elif chain
+        self._dispatch = {
+            "faithfulness": self.evaluate_faithfulness,
+            "answer_relevancy": self.evaluate_answer_relevancy,
+            "contextual_precision": self.evaluate_contextual_precision,
+            "contextual_recall": self.evaluate_contextual_recall,
+            "conversation_completeness": self.evaluate_conversation_completeness,
+            "hallucination": self.evaluate_hallucination,
+            "pii_leakage": self.evaluate_pii_leakage,
+        }
+
     def validate_metric(self, metric_name: str) -> bool:
         """Validate if the requested metric is supported."""
-        return metric_name.lower() in self.SUPPORTED_METRICS
+        return metric_name.lower() in self._METRICS_SET
+
+    @staticmethod
+    def _trivial_result(metric_name: str, output: str) -> Optional[tuple[float, str]]:
+        """Deterministic score for inputs that trivially decide a metric.
+
+        Returns None when the metric genuinely needs an LLM judgment.
+        """
+        if metric_name == "faithfulness" and not output.strip():
+            return 0.0, "Empty output cannot be faithful to the context."
+        if metric_name == "hallucination" and not output.strip():
+            return 0.0, "No output to hallucinate."
+        if metric_name == "pii_leakage" and len(output) < 8:
+            return 0.0, "Output too short to contain PII."
+        return None
     
     def create_test_case(
         self,
@@ -333,30 +835,29 @@ class MetricEvaluator:
         """
         # Handle conversational test case
         if messages is not None:
-            from deepeval.test_case import ConversationalTestCase
-            
-            # Convert messages to list of dictionaries with role and content
-            turns = []
-            for msg in messages:
-                turns.append({
-                    "role": msg.get("role", "user"),
-                    "content": msg.get("content", "")
-                })
-            
+            # Normalize to role/content dicts in a single pass
+            turns = [
+                {"role": msg.get("role", "user"), "content": msg.get("content", "")}
+                for msg in messages
+            ]
             return ConversationalTestCase(turns=turns)
-        
-        # Standard LLMTestCase for other metrics (UNCHANGED - this is the existing code)
-        from deepeval.test_case import LLMTestCase
-        
-        # Ensure context is always a list for deepeval
+
+        # Standard LLMTestCase for other metrics. Only populated fields are
+        # passed so unused optionals skip validation entirely.
         retrieval_ctx = context or []
-        
-        return LLMTestCase(
-            input=query or "",  # user question
-            actual_output=output,  # model response
-            retrieval_context=retrieval_ctx,  # RAG/context
-            expected_output=expected_output  # may be None for some metrics
-        )
+        if DEDUP_CONTEXT and retrieval_ctx:
+            # Order-preserving removal of exact duplicate passages
+            retrieval_ctx = list(dict.fromkeys(retrieval_ctx))
+
+        kwargs = {
+            "input": query or "",  # user question
+            "actual_output": output,  # model response
+            "retrieval_context": retrieval_ctx,  # RAG/context
+        }
+        if expected_output:
+            kwargs["expected_output"] = expected_output
+
+        return LLMTestCase(**kwargs)
     
     def evaluate_faithfulness(self, test_case) -> tuple[float, str]:
         """
@@ -365,18 +866,9 @@ class MetricEvaluator:
         - No additional post-processing, thresholds, or penalties.
         """
         try:
-            from deepeval.metrics.faithfulness.faithfulness import FaithfulnessMetric
-
-            metric = FaithfulnessMetric(
-                model=self.model,              # your DeepEvalBaseLLM or model name
-                include_reason=True,           # let DeepEval generate the reason
-                async_mode=False,              # keep sync in this server
-                strict_mode=False,             # no hard clamp to 0 below threshold
-                penalize_ambiguous_claims=False
-            )
-
+            metric = self._metric_factories["faithfulness"]()
             logger.info(f"[Faithfulness] Measuring with model: {self.model_name}")
-            score = metric.measure(test_case)      # DeepEval computes truths/claims/verdicts internally
+            score = metric.measure(test_case)  # DeepEval computes truths/claims/verdicts internally
             explanation = metric.reason or "Faithfulness (DeepEval core)."
             logger.info(f"[Faithfulness] Score: {score}, Explanation: {explanation[:100] if explanation else 'None'}")
             return score, explanation
@@ -391,15 +883,7 @@ class MetricEvaluator:
         - No custom post-processing or caps.
         """
         try:
-            from deepeval.metrics.answer_relevancy.answer_relevancy import AnswerRelevancyMetric
-
-            metric = AnswerRelevancyMetric(
-                model=self.model,        # DeepEvalBaseLLM or model name already init'd
-                include_reason=True,     # let DeepEval generate the reason
-                async_mode=False,        # keep server synchronous
-                strict_mode=False        # no threshold clamp
-            )
-
+            metric = self._metric_factories["answer_relevancy"]()
             logger.info(f"[Answer Relevancy] Measuring with model: {self.model_name}")
             score = metric.measure(test_case)
             explanation = metric.reason or "Answer Relevancy (DeepEval core)."
@@ -416,14 +900,7 @@ class MetricEvaluator:
         - No post-processing; returns DeepEval's score and reason.
         """
         try:
-            from deepeval.metrics.contextual_precision.contextual_precision import ContextualPrecisionMetric
-
-            metric = ContextualPrecisionMetric(
-                model=self.model,
-                include_reason=True,
-                async_mode=False,
-                strict_mode=False,
-            )
+            metric = self._metric_factories["contextual_precision"]()
             logger.info(f"[Contextual Precision] Measuring with model: {self.model_name}")
             score = metric.measure(test_case)
             explanation = metric.reason or "Contextual Precision (DeepEval core)."
@@ -436,14 +913,7 @@ class MetricEvaluator:
     def evaluate_contextual_recall(self, test_case) -> tuple[float, str]:
         """Pure DeepEval Contextual Recall (no post-processing)."""
         try:
-            from deepeval.metrics.contextual_recall.contextual_recall import ContextualRecallMetric
-
-            metric = ContextualRecallMetric(
-                model=self.model,
-                include_reason=True,
-                async_mode=False,
-                strict_mode=False,
-            )
+            metric = self._metric_factories["contextual_recall"]()
             logger.info(f"[Contextual Recall] Measuring with model: {self.model_name}")
             score = metric.measure(test_case)
             explanation = metric.reason or "Contextual Recall (DeepEval core)."
@@ -458,16 +928,7 @@ class MetricEvaluator:
         Expects a deepeval.test_case.ConversationalTestCase.
         """
         try:
-            from deepeval.metrics.conversation_completeness.conversation_completeness import (
-                ConversationCompletenessMetric,
-            )
-
-            metric = ConversationCompletenessMetric(
-                model=self.model,
-                include_reason=True,
-                async_mode=False,
-                strict_mode=False,
-            )
+            metric = self._metric_factories["conversation_completeness"]()
             logger.info(f"[Conversation Completeness] Measuring with model: {self.model_name}")
             score = metric.measure(conv_case)
             explanation = metric.reason or "Conversation Completeness (DeepEval core)."
@@ -484,14 +945,7 @@ class MetricEvaluator:
         Note: Lower is better. 0.0 = no hallucinations.
         """
         try:
-            from deepeval.metrics.hallucination.hallucination import HallucinationMetric
-
-            metric = HallucinationMetric(
-                model=self.model,
-                include_reason=True,
-                async_mode=False,
-                strict_mode=False,
-            )
+            metric = self._metric_factories["hallucination"]()
 
             # Compatibility: some pipelines set `retrieval_context` only.
             if getattr(test_case, "context", None) is None and getattr(test_case, "retrieval_context", None) is not None:
@@ -508,7 +962,6 @@ class MetricEvaluator:
         except Exception as e:
             logger.error(f"[Hallucination] Error: {str(e)}", exc_info=True)
             raise
-        return score, explanation
 
     def evaluate_pii_leakage(self, test_case) -> tuple[float, str]:
         """
@@ -524,17 +977,23 @@ class MetricEvaluator:
         
         Note: Lower is better. 0.0 = no PII detected, 1.0 = PII detected.
         Requires: actual_output (output to scan for PII)
+
+        A compiled-regex prefilter resolves mechanically detectable PII (and
+        obviously clean short outputs) before falling through to the LLM
+        judge for ambiguous classes like names and addresses.
         """
-        try:
-            from deepeval.metrics import PIILeakageMetric
+        if PII_FAST_SCAN:
+            fast = _fast_pii_scan(getattr(test_case, "actual_output", "") or "")
+            if fast is not None:
+                logger.info(f"[PII Leakage] Fast scan score: {fast[0]}")
+                return fast
 
-            metric = PIILeakageMetric(
-                model=self.model,
-                include_reason=True,
-                async_mode=False,
-                strict_mode=False,
-            )
+        if "pii_leakage" not in self._metric_factories:
+            logger.error("[PII Leakage] PIILeakageMetric not available in this version of deepeval")
+            raise ValueError("PIILeakageMetric requires deepeval >= 1.0.0. Please upgrade: pip install --upgrade deepeval")
 
+        try:
+            metric = self._metric_factories["pii_leakage"]()
             logger.info(f"[PII Leakage] Measuring with model: {self.model_name}")
             raw_score = metric.measure(test_case)
             # Invert DeepEval's compliance score: 0.0 = no PII (good), 1.0 = PII detected (bad)
@@ -542,9 +1001,6 @@ class MetricEvaluator:
             explanation = metric.reason or "PII leakage score (lower is better: 0.0 = no PII detected, 1.0 = PII found)."
             logger.info(f"[PII Leakage] Raw: {raw_score}, Inverted: {score}")
             return score, explanation
-        except ImportError:
-            logger.error("[PII Leakage] PIILeakageMetric not available in this version of deepeval")
-            raise ValueError("PIILeakageMetric requires deepeval >= 1.0.0. Please upgrade: pip install --upgrade deepeval")
         except Exception as e:
             logger.error(f"[PII Leakage] Error: {str(e)}", exc_info=True)
             raise
@@ -557,7 +1013,8 @@ class MetricEvaluator:
         context: Optional[List[str]] = None,
         output: str = "",
         expected_output: Optional[str] = None,
-        messages: Optional[List[dict]] = None
+        messages: Optional[List[dict]] = None,
+        use_cache: bool = True
     ) -> tuple[float, str]:
         """Main evaluation method that routes to specific metric evaluators.
         
@@ -576,7 +1033,8 @@ class MetricEvaluator:
             output: Model's generated response (required for most metrics)
             expected_output: Reference answer (required for contextual_* metrics)
             messages: List of conversation messages for conversation_completeness metric
-            
+            use_cache: Whether to consult/populate the persistent score cache
+
         Returns:
             Tuple of (score, explanation)
             
@@ -588,26 +1046,36 @@ class MetricEvaluator:
         if not self.validate_metric(metric_name):
             raise ValueError(f"Unsupported metric: {metric_name}. Supported: {list(self.SUPPORTED_METRICS.keys())}")
         
-        # Validate metric-specific requirements
-        if metric_name in ["contextual_precision", "contextual_recall"]:
-            # These metrics compare context vs expected answer
-            if not expected_output:
-                raise ValueError(f"{metric_name} requires 'expected_output' field")
-            if not context:
-                raise ValueError(f"{metric_name} requires 'context' field (list of retrieved passages)")
-        
-        if metric_name == "answer_relevancy":
-            if not query:
-                raise ValueError("answer_relevancy requires 'query' field (the user's question)")
-        
-        if metric_name == "conversation_completeness":
-            if not messages:
-                raise ValueError("conversation_completeness requires 'messages' field (list of conversation turns with role and content)")
-        
-        if metric_name == "hallucination":
-            if not context:
-                raise ValueError("hallucination requires 'context' field (list of source passages to check against)")
-        
+        # Validate metric-specific requirements declaratively
+        provided = {
+            "query": query,
+            "context": context,
+            "expected_output": expected_output,
+            "messages": messages,
+        }
+        for field in self._REQS.get(metric_name, ()):
+            if not provided[field]:
+                raise ValueError(f"{metric_name} requires {self._FIELD_HINTS[field]}")
+
+        # Skip the LLM round-trip when the inputs trivially decide the score
+        if SKIP_TRIVIAL:
+            trivial = self._trivial_result(metric_name, output or "")
+            if trivial is not None:
+                logger.info(f"[Short-circuit] {metric_name}: {trivial[0]}")
+                return trivial
+
+        # Serve repeated identical payloads from the persistent score cache
+        cache_key = None
+        if self.score_cache is not None and use_cache:
+            cache_key = ScoreCache.make_key(
+                metric_name, self.model_name, query, context, output,
+                expected_output, messages
+            )
+            cached = self.score_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"[Cache] Hit for {metric_name}")
+                return cached
+
         # Create test case with proper structure
         test_case = self.create_test_case(
             query=query,
@@ -617,228 +1085,571 @@ class MetricEvaluator:
             messages=messages
         )
         
-        # Route to appropriate evaluation method
-        if metric_name == "faithfulness":
-            return self.evaluate_faithfulness(test_case)
-        elif metric_name == "answer_relevancy":
-            return self.evaluate_answer_relevancy(test_case)  
-        elif metric_name == "contextual_precision":
-            return self.evaluate_contextual_precision(test_case)
-        elif metric_name == "contextual_recall":
-            return self.evaluate_contextual_recall(test_case)
-        elif metric_name == "conversation_completeness":
-            return self.evaluate_conversation_completeness(test_case)
-        elif metric_name == "hallucination":
-            return self.evaluate_hallucination(test_case)
-        elif metric_name == "pii_leakage":
-            return self.evaluate_pii_leakage(test_case)
-        else:
+        # Route to the appropriate evaluation method via the dispatch table
+        handler = self._dispatch.get(metric_name)
+        if handler is None:
             raise ValueError(f"Metric {metric_name} is not implemented yet")
+        self.model.reset_fallback_flag()
+        score, explanation = handler(test_case)
+
+        # A score judged (even partly) by the hedge fallback came from a
+        # different model than the one the cache key names, so it must not
+        # be served to later requests as the primary's judgment.
+        if cache_key is not None and not self.model.fallback_served():
+            self.score_cache.put(cache_key, score, explanation)
+
+        return score, explanation
+
+    async def evaluate_many(self, metric_names: List[str], **kwargs) -> List["MetricResult"]:
+        """Evaluate several metrics concurrently for the same inputs.
+
+        Each metric is dominated by its own independent LLM round-trips, so
+        fanning them out with asyncio.gather collapses total wall time to
+        roughly the slowest metric instead of the sum. The synchronous
+        evaluate path runs in worker threads so the event loop stays free.
+
+        Errors are captured per metric as MetricResult.error rather than
+        failing the whole batch.
+        """
+        return list(await asyncio.gather(
+            *(self.evaluate_one(name, **kwargs) for name in metric_names)
+        ))
+
+    async def evaluate_one(self, name: str, **kwargs) -> "MetricResult":
+        """Evaluate a single metric off the event loop, errors as data."""
+        try:
+            with EVAL_LATENCY.labels(name).time():
+                score, explanation = await asyncio.get_running_loop().run_in_executor(
+                    _EVAL_EXECUTOR, partial(self.evaluate, name, **kwargs)
+                )
+            EVAL_COUNT.labels(name, "success").inc()
+            logger.debug(f"✓ {name}: {score}")
+            return MetricResult(metric_name=name, score=score, explanation=explanation)
+        except ValueError as ve:
+            # Metric-specific validation error
+            EVAL_COUNT.labels(name, "invalid").inc()
+            logger.warning(f"✗ {name}: {str(ve)}")
+            return MetricResult(metric_name=name, score=None, explanation=None, error=str(ve))
+        except Exception as e:
+            # Unexpected error for this metric
+            EVAL_COUNT.labels(name, "error").inc()
+            logger.error(f"✗ {name}: {str(e)}")
+            return MetricResult(metric_name=name, score=None, explanation=None, error=f"Evaluation failed: {str(e)}")
+
+
+@dataclass(frozen=True)
+class EvalConfig:
+    """Provider settings, parsed from the environment once at import.
+
+    load_dotenv has already run by this point, so reading eagerly keeps
+    init_evaluator_from_env free of os.getenv calls and makes the provider
+    branch a constant for the life of the process.
+    """
+    provider: str
+    eval_model: str
+    openai_key: Optional[str]
+    groq_key: Optional[str]
+    azure_key: Optional[str]
+    azure_endpoint: Optional[str]
+    azure_deployment: Optional[str]
+    azure_api_version: str
+
+
+_CONFIG = EvalConfig(
+    provider=os.getenv("LLM_PROVIDER", "groq").lower().strip(),
+    eval_model=os.getenv("EVAL_MODEL", "llama-3.3-70b-versatile"),
+    openai_key=os.getenv("OPENAI_API_KEY"),
+    groq_key=os.getenv("GROQ_API_KEY"),
+    azure_key=os.getenv("AZURE_OPENAI_API_KEY"),
+    azure_endpoint=os.getenv("AZURE_OPENAI_API_ENDPOINT"),
+    azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
+    azure_api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
+)
 
 
 def init_evaluator_from_env() -> MetricEvaluator:
-    """Initialize MetricEvaluator from environment variables.
-    
+    """Initialize MetricEvaluator from the import-time EvalConfig.
+
     Supports three LLM providers via LLM_PROVIDER environment variable:
     - 'groq': Uses Groq API (via GROQ_API_KEY)
     - 'azure-openai': Uses Azure OpenAI API (via AZURE_OPENAI_API_KEY and Azure config)
     - 'openai' (default): Uses OpenAI API (via OPENAI_API_KEY)
-    
+
     Returns:
         Configured MetricEvaluator instance
-        
+
     Raises:
         ValueError: If required API keys or configuration are missing
     """
-    # Read LLM provider from environment, default to 'groq'
-    llm_provider = os.getenv("LLM_PROVIDER", "groq").lower().strip()
-    eval_model = os.getenv("EVAL_MODEL", "llama-3.3-70b-versatile")
-    
-    logger.info(f"Initializing with LLM_PROVIDER: {llm_provider}")
-    
-    if llm_provider == "azure-openai":
-        # Azure OpenAI configuration
-        api_key = os.getenv("AZURE_OPENAI_API_KEY")
-        endpoint = os.getenv("AZURE_OPENAI_API_ENDPOINT")
-        deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-        api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
-        
-        if not api_key:
+    logger.info(f"Initializing with LLM_PROVIDER: {_CONFIG.provider}")
+
+    if _CONFIG.provider == "azure-openai":
+        if not _CONFIG.azure_key:
             raise ValueError("AZURE_OPENAI_API_KEY environment variable is required when using Azure OpenAI")
-        if not endpoint:
+        if not _CONFIG.azure_endpoint:
             raise ValueError("AZURE_OPENAI_API_ENDPOINT environment variable is required when using Azure OpenAI")
-        if not deployment:
+        if not _CONFIG.azure_deployment:
             raise ValueError("AZURE_OPENAI_DEPLOYMENT_NAME environment variable is required when using Azure OpenAI")
-        
-        logger.info(f"Using Azure OpenAI API for evaluation with deployment: {deployment}")
+
+        logger.info(f"Using Azure OpenAI API for evaluation with deployment: {_CONFIG.azure_deployment}")
         return MetricEvaluator(
-            api_key=api_key,
-            model_name=eval_model,
+            api_key=_CONFIG.azure_key,
+            model_name=_CONFIG.eval_model,
             use_azure=True,
-            azure_endpoint=endpoint,
-            azure_deployment=deployment,
-            azure_api_version=api_version
+            azure_endpoint=_CONFIG.azure_endpoint,
+            azure_deployment=_CONFIG.azure_deployment,
+            azure_api_version=_CONFIG.azure_api_version
         )
-    
-    elif llm_provider == "groq":
-        # Groq configuration
-        api_key = os.getenv("GROQ_API_KEY")
-        
-        if not api_key:
+
+    elif _CONFIG.provider == "groq":
+        if not _CONFIG.groq_key:
             raise ValueError("GROQ_API_KEY environment variable is required when using Groq")
-        
-        logger.info(f"Using Groq API for evaluation with model: {eval_model}")
+
+        logger.info(f"Using Groq API for evaluation with model: {_CONFIG.eval_model}")
         return MetricEvaluator(
-            api_key=api_key,
-            model_name=eval_model,
+            api_key=_CONFIG.groq_key,
+            model_name=_CONFIG.eval_model,
             use_groq=True
         )
-    
-    elif llm_provider == "openai":
-        # OpenAI configuration
-        api_key = os.getenv("OPENAI_API_KEY")
-        
-        if not api_key:
+
+    elif _CONFIG.provider == "openai":
+        if not _CONFIG.openai_key:
             raise ValueError("OPENAI_API_KEY environment variable is required when using OpenAI")
-        
+
         # Override model if not a valid GPT model
-        actual_model = eval_model if eval_model.startswith("gpt-") else "gpt-4o-mini"
-        if actual_model != eval_model:
-            logger.warning(f"EVAL_MODEL '{eval_model}' is not a valid GPT model, using '{actual_model}' instead")
-        
+        actual_model = _CONFIG.eval_model if _CONFIG.eval_model.startswith("gpt-") else "gpt-4o-mini"
+        if actual_model != _CONFIG.eval_model:
+            logger.warning(f"EVAL_MODEL '{_CONFIG.eval_model}' is not a valid GPT model, using '{actual_model}' instead")
+
         logger.info(f"Using OpenAI API for evaluation with model: {actual_model}")
         return MetricEvaluator(
-            api_key=api_key,
+            api_key=_CONFIG.openai_key,
             model_name=actual_model,
             use_groq=False
         )
-    
+
     else:
-        raise ValueError(f"Unsupported LLM_PROVIDER: {llm_provider}. Supported values: 'groq', 'openai', 'azure-openai'")
+        raise ValueError(f"Unsupported LLM_PROVIDER: {_CONFIG.provider}. Supported values: 'groq', 'openai', 'azure-openai'")
 
 
-@app.post("/eval", response_model=EvalResponse)
-async def evaluate_llm_response(req: EvalRequest):
+# Hot-path views of the metric catalog, computed once at import so the /eval
+# validation loop is pure set lookups on already-normalized names.
+_SUPPORTED = frozenset(MetricEvaluator.SUPPORTED_METRICS)
+_NEEDS_MESSAGES = frozenset({"conversation_completeness"})
+
+# Process-wide evaluator singleton. Building a MetricEvaluator constructs LLM
+# SDK clients, so doing it per request would throw away the shared connection
+# pool on every call.
+_evaluator: Optional[MetricEvaluator] = None
+
+
+def get_evaluator() -> MetricEvaluator:
+    """Return the cached MetricEvaluator, creating it on first use."""
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = init_evaluator_from_env()
+    return _evaluator
+
+
+_evaluator_init_lock = asyncio.Lock()
+
+
+@app.on_event("startup")
+async def _warmup():
+    """Build the evaluator before traffic arrives.
+
+    A fresh worker otherwise pays DeepEval's cold construction cost (metric
+    objects, LLM clients) inside the first user-facing request. The lock
+    guards against concurrent initialization if a request lands while the
+    warm-up is still running.
     """
-    Evaluate an LLM response using one or more metrics.
-    
-    Supports:
-    - Single metric: metric="faithfulness"
-    - Multiple metrics: metric=["faithfulness", "answer_relevancy"]
-    - All metrics: metric="all"
-    
-    Each metric can be used independently to teach specific evaluation concepts.
-    
-    Args:
-        req: EvalRequest with query, context, output, metric type(s), and optional provider
-        
-    Returns:
-        EvalResponse with array of metric results
+    async with _evaluator_init_lock:
+        global _evaluator
+        if _evaluator is None:
+            try:
+                _evaluator = await asyncio.to_thread(init_evaluator_from_env)
+                logger.info("Evaluator warmed up at startup")
+            except Exception as e:
+                # A missing key should not kill the worker; the first request
+                # will surface the configuration error instead.
+                logger.warning(f"Startup warm-up skipped: {e}")
+
+    # Pre-warm the TLS session to the provider so the first /eval does not
+    # pay the handshake on its critical path. The HEAD goes through _HTTP —
+    # the pool every LLM call rides — so the session lands where it is
+    # reused.
+    client = getattr(_evaluator.model, "client", None) if _evaluator else None
+    if client is not None:
+        try:
+            await asyncio.to_thread(_HTTP.head, str(client.base_url), timeout=5.0)
+            logger.info(f"Pre-warmed connection to {client.base_url}")
+        except Exception:
+            # Best effort: some providers reject HEAD, but the TLS session
+            # is established either way
+            logger.debug("Connection pre-warm failed (ignored)")
+
+
+@app.on_event("shutdown")
+async def _close_http_clients():
+    """Release the shared HTTP connection pool on worker shutdown."""
+    _HTTP.close()
+
+
+def _parse_metrics(req: EvalRequest) -> List[str]:
+    """Normalize req.metric into a validated lowercase metric list.
+
+    Shared by /eval and /eval/stream. Raises HTTPException(400) for unknown
+    metrics or inputs missing the fields a requested metric needs.
     """
-    # Parse metric parameter - can be string, array, or "all"
+    # Parse metric parameter - can be string, array, or "all".
+    # Names are lowercased once here; everything downstream relies on it.
     metric_param = req.metric or "faithfulness"
-    
-    # Convert to list of metrics
+
+    # Convert to a normalized list of metrics
     if isinstance(metric_param, str):
         if metric_param.lower() == "all":
-            # Get all supported metrics except conversation_completeness if no messages
-            metrics_to_eval = list(MetricEvaluator.SUPPORTED_METRICS.keys())
-            if not req.messages and "conversation_completeness" in metrics_to_eval:
-                metrics_to_eval.remove("conversation_completeness")
+            # All supported metrics, except conversation_completeness when
+            # no conversation was provided
+            metrics_to_eval = [
+                m for m in MetricEvaluator.SUPPORTED_METRICS
+                if req.messages or m not in _NEEDS_MESSAGES
+            ]
         else:
-            metrics_to_eval = [metric_param]
+            metrics_to_eval = [metric_param.lower()]
     else:
-        metrics_to_eval = metric_param
-    
-    # Validate minimal fields for each metric
+        metrics_to_eval = [m.lower() for m in metric_param]
+
+    # Validate minimal fields for each metric with set lookups
     for metric_name in metrics_to_eval:
-        metric_name_lower = metric_name.lower()
-        
+        if metric_name not in _SUPPORTED:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported metric: {metric_name}. Supported: {sorted(_SUPPORTED)}"
+            )
+
         # For conversation_completeness, messages are required instead of output
-        if metric_name_lower == "conversation_completeness":
+        if metric_name in _NEEDS_MESSAGES:
             if not req.messages:
                 raise HTTPException(
-                    status_code=400, 
+                    status_code=400,
                     detail="messages field is required for conversation_completeness metric"
                 )
         else:
             if not req.output:
                 raise HTTPException(
-                    status_code=400, 
-                    detail=f"output field is required for {metric_name_lower} metric"
+                    status_code=400,
+                    detail=f"output field is required for {metric_name} metric"
                 )
+
+    return metrics_to_eval
+
+
+@app.post("/eval", response_model=EvalResponse, response_model_exclude_none=True)
+async def evaluate_llm_response(req: EvalRequest, no_cache: bool = False):
+    """
+    Evaluate an LLM response using one or more metrics.
+    
+    Supports:
+    - Single metric: metric="faithfulness"
+    - Multiple metrics: metric=["faithfulness", "answer_relevancy"]
+    - All metrics: metric="all"
+    
+    Each metric can be used independently to teach specific evaluation concepts.
     
+    Args:
+        req: EvalRequest with query, context, output, metric type(s), and optional provider
+        no_cache: Set ?no_cache=1 to bypass the persistent score cache
+
+    Returns:
+        EvalResponse with array of metric results
+    """
+    metrics_to_eval = _parse_metrics(req)
+
+    # Admission control: shed load if we cannot start within the queue budget
     try:
-        logger.info(f"=== Evaluation Request ===")
-        logger.info(f"Metrics: {metrics_to_eval}")
-        logger.info(f"Query: {req.query[:100] + '...' if req.query and len(req.query) > 100 else req.query or 'None'}")
-        logger.info(f"Context items: {len(req.context) if req.context else 0}")
-        logger.info(f"Output length: {len(req.output) if req.output else 0}")
-        logger.info(f"Expected output: {'provided' if req.expected_output else 'None'}")
-        logger.info(f"Messages: {len(req.messages) if req.messages else 0} turns")
-        
-        # Initialize evaluator from environment
-        evaluator = init_evaluator_from_env()
-        
-        # Evaluate each metric
-        results = []
-        for metric_name in metrics_to_eval:
-            try:
-                score, explanation = evaluator.evaluate(
-                    metric_name=metric_name,
-                    query=req.query,
-                    context=req.context,
-                    output=req.output,
-                    expected_output=req.expected_output,
-                    messages=req.messages
-                )
-                
-                results.append(MetricResult(
-                    metric_name=metric_name,
-                    score=score,
-                    explanation=explanation
-                ))
-                
-                logger.info(f"✓ {metric_name}: {score}")
-                
-            except ValueError as ve:
-                # Metric-specific validation error
-                logger.warning(f"✗ {metric_name}: {str(ve)}")
-                results.append(MetricResult(
-                    metric_name=metric_name,
-                    score=None,
-                    explanation=None,
-                    error=str(ve)
-                ))
-            except Exception as e:
-                # Unexpected error for this metric
-                logger.error(f"✗ {metric_name}: {str(e)}")
-                results.append(MetricResult(
-                    metric_name=metric_name,
-                    score=None,
-                    explanation=None,
-                    error=f"Evaluation failed: {str(e)}"
-                ))
+        await asyncio.wait_for(_EVAL_SEM.acquire(), timeout=QUEUE_TIMEOUT_MS / 1000.0)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=429,
+            detail="Evaluation capacity saturated, retry later",
+            headers={"Retry-After": "1"}
+        )
+
+    try:
+        # Guard the banner so the slicing/len/ternary f-strings are never
+        # built when INFO is filtered out — this runs on every request.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"=== Evaluation Request ===")
+            logger.info(f"Metrics: {metrics_to_eval}")
+            logger.info(f"Query: {req.query[:100] + '...' if req.query and len(req.query) > 100 else req.query or 'None'}")
+            logger.info(f"Context items: {len(req.context) if req.context else 0}")
+            logger.info(f"Output length: {len(req.output) if req.output else 0}")
+            logger.info(f"Expected output: {'provided' if req.expected_output else 'None'}")
+            logger.info(f"Messages: {len(req.messages) if req.messages else 0} turns")
         
-        # Build response with backward compatibility
-        response = EvalResponse(results=results)
+        # Reuse the process-wide evaluator (shared LLM clients + pool)
+        evaluator = get_evaluator()
         
-        # For backward compatibility: populate legacy fields with first successful result
-        # This ensures existing clients that expect metric/score/explanation still work
-        for result in results:
-            if result.score is not None:  # First successful result
-                response.metric_name = result.metric_name
-                response.score = result.score
-                response.explanation = result.explanation
-                response.error = result.error
-                break
+        # All metric evaluations go through the concurrent path: a single
+        # metric still runs off the event loop in a worker thread, and
+        # multiple metrics overlap their independent LLM round-trips
+        results = await evaluator.evaluate_many(
+            metrics_to_eval,
+            query=req.query,
+            context=req.context,
+            output=req.output,
+            expected_output=req.expected_output,
+            messages=req.messages,
+            use_cache=not (no_cache or req.cache_bypass)
+        )
         
-        return response
+        # Legacy clients expect metric/score/explanation at the top level,
+        # mirroring the first successful result. The results are already
+        # trusted internal objects, so model_construct skips re-validation
+        # and the response is built in a single call.
+        first = next((r for r in results if r.score is not None), None)
+        return EvalResponse.model_construct(
+            results=results,
+            metric_name=first.metric_name if first else None,
+            score=first.score if first else None,
+            explanation=first.explanation if first else None,
+            error=first.error if first else None,
+        )
     
     except Exception as e:
         # Unexpected errors (API failures, etc.)
         logger.exception("Evaluation error")
         raise HTTPException(status_code=500, detail="Internal server error")
+    finally:
+        _EVAL_SEM.release()
+
+
+@app.post("/eval/stream")
+async def evaluate_llm_response_stream(req: EvalRequest, no_cache: bool = False):
+    """
+    Evaluate like /eval but stream each metric result as it completes.
+
+    The response is NDJSON: one MetricResult JSON object per line, in
+    completion order rather than request order. With metric="all" the
+    first line arrives after the fastest metric instead of the slowest,
+    so dashboards can render progressively. /eval is unchanged for
+    clients that want the aggregate payload.
+
+    Args:
+        req: EvalRequest with query, context, output, metric type(s), and optional provider
+        no_cache: Set ?no_cache=1 to bypass the persistent score cache
+
+    Returns:
+        StreamingResponse of application/x-ndjson lines
+    """
+    metrics_to_eval = _parse_metrics(req)
+
+    # Resolve the evaluator before taking a permit: first-use construction
+    # can raise (e.g. missing provider key), and a failure after acquire
+    # would leak the permit since release lives in the stream generator.
+    evaluator = get_evaluator()
+
+    # Admission control: same budget as /eval, released when the stream ends
+    try:
+        await asyncio.wait_for(_EVAL_SEM.acquire(), timeout=QUEUE_TIMEOUT_MS / 1000.0)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=429,
+            detail="Evaluation capacity saturated, retry later",
+            headers={"Retry-After": "1"}
+        )
+
+    kwargs = dict(
+        query=req.query,
+        context=req.context,
+        output=req.output,
+        expected_output=req.expected_output,
+        messages=req.messages,
+        use_cache=not (no_cache or req.cache_bypass)
+    )
+
+    async def _ndjson():
+        tasks = [
+            asyncio.ensure_future(evaluator.evaluate_one(name, **kwargs))
+            for name in metrics_to_eval
+        ]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                result = await fut
+                yield orjson.dumps(result.model_dump()) + b"\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+            _EVAL_SEM.release()
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
+@app.post("/eval/batch", response_model=EvalBatchResponse, response_model_exclude_none=True)
+async def evaluate_llm_batch(req: EvalBatchRequest, no_cache: bool = False):
+    """
+    Evaluate many test cases in one call with bounded concurrent fan-out.
+
+    Clients iterating a dataset against /eval pay per-call HTTP and routing
+    overhead and serialize the LLM waits. This endpoint fans the items out
+    concurrently (capped by max_concurrency and the server-wide in-flight
+    limit) and returns results in input order. Per-item validation errors
+    become error entries instead of failing the whole batch.
+
+    Args:
+        req: EvalBatchRequest with the items to evaluate and max_concurrency
+        no_cache: Set ?no_cache=1 to bypass the persistent score cache
+
+    Returns:
+        EvalBatchResponse with one EvalResponse per item
+    """
+    sem = asyncio.Semaphore(max(1, min(req.max_concurrency, MAX_IN_FLIGHT)))
+
+    async def _one(item: EvalRequest) -> EvalResponse:
+        async with sem:
+            try:
+                return await evaluate_llm_response(item, no_cache=no_cache)
+            except HTTPException as he:
+                # Surface validation/capacity errors per item
+                return EvalResponse.model_construct(results=[], error=str(he.detail))
+
+    items = await asyncio.gather(*(_one(item) for item in req.items))
+    return EvalBatchResponse.model_construct(items=list(items))
+
+
+# Coarse single-call judge prompt used for offline Batch API scoring. The
+# interactive endpoints run DeepEval's multi-step metric chains; those chains
+# cannot be pre-rendered into a static JSONL, so batch submissions trade that
+# granularity for one judge call per (item, metric).
+_BATCH_JUDGE_TEMPLATE = """You are an LLM evaluation judge. Score the metric '{metric}' for the following case on a 0.0-1.0 scale ({direction}).
+
+Query: {query}
+Context: {context}
+Output: {output}
+Expected output: {expected_output}
+
+Respond with valid JSON only: {{"score": <float>, "reason": "<short explanation>"}}"""
+
+
+def _openai_batch_client() -> OpenAI:
+    """Client for OpenAI Batch API submissions.
+
+    Reuses the evaluator's client when the active provider is OpenAI,
+    otherwise falls back to OPENAI_API_KEY — the Batch API is OpenAI-only.
+    """
+    evaluator = get_evaluator()
+    if isinstance(evaluator.model, OpenAIModel):
+        return evaluator.model.client
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise HTTPException(
+            status_code=503,
+            detail="OpenAI Batch API requires OPENAI_API_KEY"
+        )
+    return OpenAI(api_key=api_key, http_client=_HTTP)
+
+
+@app.post("/eval/batch/submit")
+async def submit_eval_batch(req: EvalBatchRequest):
+    """
+    Submit a non-interactive evaluation corpus to the OpenAI Batch API.
+
+    Batch jobs complete within 24h at roughly half the realtime token cost
+    and do not consume synchronous rate limits — the right trade for CI runs
+    and nightly regressions. Each (item, metric) pair becomes one JSONL
+    request with custom_id "<item_index>:<metric>"; poll the returned
+    batch_id via GET /eval/batch/{batch_id}.
+    """
+    client = _openai_batch_client()
+    model = os.getenv("BATCH_EVAL_MODEL", "gpt-4o-mini")
+
+    lines = []
+    for i, item in enumerate(req.items):
+        metric_param = item.metric or "faithfulness"
+        if isinstance(metric_param, str):
+            metrics = list(_SUPPORTED) if metric_param.lower() == "all" else [metric_param.lower()]
+        else:
+            metrics = [m.lower() for m in metric_param]
+
+        for metric_name in metrics:
+            if metric_name not in _SUPPORTED or metric_name in _NEEDS_MESSAGES:
+                continue
+            prompt = _BATCH_JUDGE_TEMPLATE.format(
+                metric=metric_name,
+                direction="lower is better" if metric_name in _INVERSE_METRICS else "higher is better",
+                query=item.query or "",
+                context=item.context or [],
+                output=item.output or "",
+                expected_output=item.expected_output or ""
+            )
+            lines.append(orjson.dumps({
+                "custom_id": f"{i}:{metric_name}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.0,
+                    "response_format": {"type": "json_object"}
+                }
+            }))
+
+    if not lines:
+        raise HTTPException(status_code=400, detail="No valid (item, metric) pairs to submit")
+
+    payload = b"\n".join(lines) + b"\n"
+
+    def _submit():
+        upload = client.files.create(file=("eval_batch.jsonl", payload), purpose="batch")
+        return client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+    batch = await asyncio.to_thread(_submit)
+    logger.info(f"Submitted batch {batch.id} with {len(lines)} judge requests")
+    return {"batch_id": batch.id, "status": batch.status, "submitted": len(lines)}
+
+
+@app.get("/eval/batch/{batch_id}")
+async def get_eval_batch(batch_id: str):
+    """Poll a submitted batch and parse its results once completed."""
+    client = _openai_batch_client()
+
+    def _fetch():
+        batch = client.batches.retrieve(batch_id)
+        results = None
+        if batch.status == "completed" and batch.output_file_id:
+            raw = client.files.content(batch.output_file_id).content
+            results = []
+            for line in raw.splitlines():
+                if not line.strip():
+                    continue
+                entry = orjson.loads(line)
+                item_index, _, metric_name = entry.get("custom_id", "::").partition(":")
+                score = explanation = error = None
+                try:
+                    body = (entry.get("response") or {}).get("body") or {}
+                    parsed = orjson.loads(body["choices"][0]["message"]["content"])
+                    score = float(parsed["score"])
+                    explanation = parsed.get("reason")
+                except Exception as parse_err:
+                    error = f"Failed to parse batch result: {parse_err}"
+                results.append({
+                    "item": int(item_index) if item_index.isdigit() else None,
+                    "metric_name": metric_name,
+                    "score": score,
+                    "explanation": explanation,
+                    "error": error
+                })
+        return batch, results
+
+    batch, results = await asyncio.to_thread(_fetch)
+    payload = {"batch_id": batch.id, "status": batch.status}
+    if results is not None:
+        payload["results"] = results
+    return payload
 
 
 @app.get("/health")
@@ -867,13 +1678,19 @@ async def example_evaluation():
             metric="faithfulness"
         )
         
-        evaluator = init_evaluator_from_env()
-        score, explanation = evaluator.evaluate(
-            metric_name="faithfulness",
-            query=test_req.query,
-            context=test_req.context,
-            output=test_req.output,
-            expected_output=None
+        evaluator = get_evaluator()
+        # Run off the event loop like the eval endpoints: a smoke test must
+        # not stall concurrent /eval requests while the LLM chain runs
+        score, explanation = await asyncio.get_running_loop().run_in_executor(
+            _EVAL_EXECUTOR,
+            partial(
+                evaluator.evaluate,
+                "faithfulness",
+                query=test_req.query,
+                context=test_req.context,
+                output=test_req.output,
+                expected_output=None
+            )
         )
         
         return {
@@ -900,72 +1717,73 @@ async def example_evaluation():
         }
 
 
-@app.get("/metrics-info")
-async def metrics_info():
-    """Get available metrics information including required and recommended fields per metric.
-    
-    Provides complete field requirements:
-    - faithfulness: output (required), context + query (recommended)
-    - answer_relevancy: query + output (required)
-    - contextual_precision/recall: context + output + expected_output (required)
+# Documentation-level field requirements per metric, shared by every caller
+# that describes the API. Tuples keep the table immutable and shareable.
+_METRIC_REQUIREMENTS: dict = {
+    "faithfulness": {
+        "required": ("output",),
+        "recommended": ("context", "query"),
+        "optional": ()
+    },
+    "answer_relevancy": {
+        "required": ("query", "output"),
+        "recommended": ("context",),
+        "optional": ()
+    },
+    "contextual_precision": {
+        "required": ("context", "output", "expected_output"),
+        "recommended": ("query",),
+        "optional": ()
+    },
+    "contextual_recall": {
+        "required": ("context", "output", "expected_output"),
+        "recommended": ("query",),
+        "optional": ()
+    },
+    "conversation_completeness": {
+        "required": ("messages",),
+        "recommended": (),
+        "optional": ("query",)
+    },
+    "hallucination": {
+        "required": ("output", "context"),
+        "recommended": ("query",),
+        "optional": ()
+    },
+    "pii_leakage": {
+        "required": ("output",),
+        "recommended": (),
+        "optional": ("query", "context")
+    }
+}
+
+# Metrics scored lower-is-better (0 = clean)
+_INVERSE_METRICS = frozenset({"hallucination", "pii_leakage"})
+
+
+def _build_metrics_info() -> dict:
+    """Assemble the /metrics-info payload.
+
+    The payload depends only on MetricEvaluator.SUPPORTED_METRICS and the
+    module-level requirement tables, so it is built (and serialized) exactly
+    once at import time rather than per GET.
     """
     metrics = []
-    
-    # Define required/optional fields per metric
-    metric_requirements = {
-        "faithfulness": {
-            "required": ["output"],
-            "recommended": ["context", "query"],
-            "optional": []
-        },
-        "answer_relevancy": {
-            "required": ["query", "output"],
-            "recommended": ["context"],
-            "optional": []
-        },
-        "contextual_precision": {
-            "required": ["context", "output", "expected_output"],
-            "recommended": ["query"],
-            "optional": []
-        },
-        "contextual_recall": {
-            "required": ["context", "output", "expected_output"],
-            "recommended": ["query"],
-            "optional": []
-        },
-        "conversation_completeness": {
-            "required": ["messages"],
-            "recommended": [],
-            "optional": ["query"]
-        },
-        "hallucination": {
-            "required": ["output", "context"],
-            "recommended": ["query"],
-            "optional": []
-        },
-        "pii_leakage": {
-            "required": ["output"],
-            "recommended": [],
-            "optional": ["query", "context"]
-        }
-    }
-    
+
     for metric_name, description in MetricEvaluator.SUPPORTED_METRICS.items():
-        requirements = metric_requirements.get(metric_name, {})
-        
-        # Hallucination and PII Leakage have inverse scoring (lower is better)
-        higher_is_better = True if metric_name not in ["hallucination", "pii_leakage"] else False
-        
+        requirements = _METRIC_REQUIREMENTS.get(metric_name, {})
+
         metrics.append({
             "name": metric_name,
             "description": description,
             "endpoint": "/eval",
             "parameter": f'"metric": "{metric_name}"',
             "range": "0.0 to 1.0",
-            "higher_is_better": higher_is_better,
-            "required_fields": requirements.get("required", []),
-            "recommended_fields": requirements.get("recommended", []),
-            "optional_fields": requirements.get("optional", [])
+            # Hallucination and PII Leakage have inverse scoring (lower is better)
+            "higher_is_better": metric_name not in _INVERSE_METRICS,
+            "required_fields": requirements.get("required", ()),
+            "recommended_fields": requirements.get("recommended", ()),
+            "optional_fields": requirements.get("optional", ())
         })
     
     return {
@@ -1047,15 +1865,40 @@ async def metrics_info():
     }
 
 
+# Static payload serialized once; the handler is a plain memcpy.
+_METRICS_INFO_BYTES = orjson.dumps(_build_metrics_info())
+
+
+@app.get("/metrics-info")
+async def metrics_info():
+    """Get available metrics information including required and recommended fields per metric.
+
+    Provides complete field requirements:
+    - faithfulness: output (required), context + query (recommended)
+    - answer_relevancy: query + output (required)
+    - contextual_precision/recall: context + output + expected_output (required)
+
+    The payload is static, so it is built and serialized once at import time.
+    """
+    return Response(content=_METRICS_INFO_BYTES, media_type="application/json")
+
+
 if __name__ == "__main__":
     import uvicorn
-    
+
     logger.info("Starting Deepeval Evaluation Service...")
     logger.info("API documentation available at http://localhost:8000/docs")
-    
+
+    # Import string (not the app object) so uvicorn can fork workers; each
+    # worker builds its own evaluator in the startup handler. uvloop and
+    # httptools cut event-loop and HTTP parsing overhead on this I/O-bound
+    # hot path.
     uvicorn.run(
-        app,
+        "deepeval_server:app",
         host="0.0.0.0",
         port=8000,
+        workers=int(os.getenv("WORKERS", "4")),
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
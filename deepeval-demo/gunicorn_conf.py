@@ -0,0 +1,20 @@
+"""Gunicorn configuration for the Deepeval sidecar.
+
+Run with:
+  gunicorn -c gunicorn_conf.py deepeval_server:app
+
+Each worker is a full uvicorn event loop with its own LLM client pool, so
+network-bound evaluation traffic spreads across processes instead of sharing
+one loop's socket pool.
+"""
+
+import multiprocessing
+
+# Evaluation requests spend their time awaiting LLM round-trips, so more
+# workers than the classic CPU-bound heuristic pays off.
+workers = max(2, 2 * multiprocessing.cpu_count())
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = "0.0.0.0:8000"
+
+# Keep upstream connections from the Node.js server alive between calls
+keepalive = 75